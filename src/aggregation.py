@@ -79,6 +79,42 @@ def compute_temporal_weight(
     return weight
 
 
+def compute_temporal_weights(
+    review_dates: List[datetime],
+    reference_date: datetime,
+    half_life_days: int = DEFAULT_HALF_LIFE_DAYS
+) -> List[float]:
+    """
+    Compute temporal weights for many dates at once.
+    
+    Same values as calling compute_temporal_weight per date, but the decay
+    is evaluated once per distinct day count (reviews cluster on the same
+    days, so most dates reuse an earlier result).
+    
+    Args:
+        review_dates: When each review was posted
+        reference_date: The reference point (usually analysis date = today)
+        half_life_days: Days after which weight is halved
+        
+    Returns:
+        Weights aligned with review_dates
+    """
+    weight_by_days: Dict[int, float] = {}
+    weights = []
+    
+    for review_date in review_dates:
+        # Clamp to non-negative (future dates would have negative days_ago)
+        days_ago = max(0, (reference_date - review_date).days)
+        
+        weight = weight_by_days.get(days_ago)
+        if weight is None:
+            weight = math.pow(2, -days_ago / half_life_days)
+            weight_by_days[days_ago] = weight
+        weights.append(weight)
+    
+    return weights
+
+
 def compute_weights_for_reviews(
     reviews: List[RawReview],
     reference_date: Optional[datetime] = None,
@@ -98,22 +134,20 @@ def compute_weights_for_reviews(
     if reference_date is None:
         reference_date = datetime.now()
     
-    weights = {}
-    for review in reviews:
-        weights[review.review_id] = compute_temporal_weight(
-            review.review_date,
-            reference_date,
-            half_life_days
-        )
+    weights = compute_temporal_weights(
+        [review.review_date for review in reviews],
+        reference_date,
+        half_life_days
+    )
     
-    return weights
+    return {review.review_id: weight for review, weight in zip(reviews, weights)}
 
 
 # =============================================================================
 # DATA COLLECTION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AspectDataPoint:
     """Single data point for aspect aggregation."""
     review_id: str
@@ -19,6 +19,7 @@ Design Decisions:
 """
 
 import re
+from functools import lru_cache
 from typing import List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
 from src.schemas import Aspect, AspectMatch
@@ -333,6 +334,17 @@ EXCLUSION_CONTEXTS: Dict[Aspect, Set[str]] = {
 }
 
 
+# Inverted index: keyword -> [(aspect, weight), ...] across all aspect lexicons,
+# so one pass over a sentence's words finds keyword hits for every aspect
+_KEYWORD_INDEX: Dict[str, List[Tuple[Aspect, float]]] = {}
+for _aspect, _lexicon in ASPECT_LEXICONS.items():
+    for _keyword, _weight in _lexicon.items():
+        _KEYWORD_INDEX.setdefault(_keyword, []).append((_aspect, _weight))
+del _aspect, _lexicon, _keyword, _weight
+
+_NON_WORD_SUB = re.compile(r'[^\w]').sub
+
+
 # =============================================================================
 # DETECTION FUNCTIONS
 # =============================================================================
@@ -360,32 +372,26 @@ def _find_multi_word_matches(text: str, aspect: Aspect) -> List[Tuple[str, float
     return matches
 
 
-def _find_keyword_matches(text: str, aspect: Aspect) -> List[Tuple[str, float, int]]:
+def _find_keyword_matches(clean_words: List[str]) -> Dict[Aspect, List[Tuple[str, float, int]]]:
     """
-    Find single keyword matches in text.
+    Find single keyword matches for every aspect in one pass.
     
+    Args:
+        clean_words: Lowercased sentence words with punctuation removed
+        
     Returns:
-        List of (keyword, weight, position) tuples
+        Dict mapping aspect to its (keyword, weight, position) tuples, in word order
     """
-    matches = []
-    words = text.lower().split()
+    matches: Dict[Aspect, List[Tuple[str, float, int]]] = {}
     
-    if aspect not in ASPECT_LEXICONS:
-        return matches
-    
-    lexicon = ASPECT_LEXICONS[aspect]
-    
-    for i, word in enumerate(words):
-        # Remove punctuation and _NEG marker for matching
-        clean_word = re.sub(r'[^\w]', '', word.replace('_NEG', ''))
-        
-        if clean_word in lexicon:
-            matches.append((clean_word, lexicon[clean_word], i))
+    for i, clean_word in enumerate(clean_words):
+        for aspect, weight in _KEYWORD_INDEX.get(clean_word, ()):
+            matches.setdefault(aspect, []).append((clean_word, weight, i))
     
     return matches
 
 
-def _check_exclusion_context(text: str, aspect: Aspect, match_position: int) -> bool:
+def _check_exclusion_context(clean_words: List[str], aspect: Aspect, match_position: int) -> bool:
     """
     Check if match should be excluded based on surrounding context.
     
@@ -395,21 +401,25 @@ def _check_exclusion_context(text: str, aspect: Aspect, match_position: int) ->
     if aspect not in EXCLUSION_CONTEXTS:
         return False
     
-    words = text.lower().split()
     exclusions = EXCLUSION_CONTEXTS[aspect]
     
     # Check 3 words before and after the match position
     window_start = max(0, match_position - 3)
-    window_end = min(len(words), match_position + 4)
+    window_end = min(len(clean_words), match_position + 4)
     
     for i in range(window_start, window_end):
-        clean_word = re.sub(r'[^\w]', '', words[i])
-        if clean_word in exclusions:
+        if clean_words[i] in exclusions:
             return True
     
     return False
 
 
+@lru_cache(maxsize=None)
+def _negated_keyword_pattern(keyword: str) -> "re.Pattern[str]":
+    """Compiled "<keyword>_NEG" pattern, built once per keyword."""
+    return re.compile(r'\b' + re.escape(keyword) + r'_NEG\b', re.IGNORECASE)
+
+
 def _check_negation_in_match(text: str, keyword: str) -> bool:
     """
     Check if the matched keyword is negated (has _NEG marker).
@@ -418,8 +428,7 @@ def _check_negation_in_match(text: str, keyword: str) -> bool:
         True if keyword appears negated in text
     """
     # Look for keyword with _NEG suffix
-    pattern = r'\b' + re.escape(keyword) + r'_NEG\b'
-    return bool(re.search(pattern, text, re.IGNORECASE))
+    return _negated_keyword_pattern(keyword).search(text) is not None
 
 
 def detect_aspects_in_sentence(sentence: str) -> List[AspectMatch]:
@@ -441,6 +450,12 @@ def detect_aspects_in_sentence(sentence: str) -> List[AspectMatch]:
     """
     results = []
     
+    # Clean each word once (lowercase, no punctuation) for keyword and exclusion checks
+    clean_words = [
+        _NON_WORD_SUB('', word.replace('_NEG', '')) for word in sentence.lower().split()
+    ]
+    all_keyword_matches = _find_keyword_matches(clean_words)
+    
     for aspect in Aspect:
         matched_keywords = []
         total_weight = 0.0
@@ -453,11 +468,11 @@ def detect_aspects_in_sentence(sentence: str) -> List[AspectMatch]:
             total_weight += weight
         
         # 2. Check single keywords
-        keyword_matches = _find_keyword_matches(sentence, aspect)
+        keyword_matches = all_keyword_matches.get(aspect, [])
         
         for keyword, weight, position in keyword_matches:
             # Skip if in exclusion context
-            if _check_exclusion_context(sentence, aspect, position):
+            if _check_exclusion_context(clean_words, aspect, position):
                 continue
             
             # Check if already covered by a multi-word phrase
@@ -101,9 +101,13 @@ def compute_disagreement(scores: List[float]) -> float:
     if len(scores) < 2:
         return 0.0
     
-    # Count positive, negative, neutral
-    positive = sum(1 for s in scores if s > 0.2)
-    negative = sum(1 for s in scores if s < -0.2)
+    # Count positive, negative, neutral (single pass)
+    positive = negative = 0
+    for s in scores:
+        if s > 0.2:
+            positive += 1
+        elif s < -0.2:
+            negative += 1
     total_opinionated = positive + negative
     
     if total_opinionated == 0:
@@ -14,16 +14,15 @@ The pipeline is designed to be:
 - Efficient: Batch processing where possible
 """
 
-import uuid
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 
 from src.schemas import (
     RawReview, ProcessedSentence, AspectMatch,
     ListingIntelligence, Aspect
 )
-from src.preprocessing import preprocess_review
+from src.preprocessing import preprocess_review, preprocess_batch
 from src.aspect_detection import detect_aspects_in_sentence
 from src.sentiment_analysis import analyze_aspects_sentiments
 from src.aggregation import (
@@ -44,10 +43,11 @@ def stage_preprocess(reviews: List[RawReview]) -> Dict[str, List[str]]:
     Returns:
         Dict mapping review_id to list of processed sentences
     """
+    preprocessed = preprocess_batch([review.review_text for review in reviews])
+    
     results = {}
-    for review in reviews:
-        preprocessed = preprocess_review(review.review_text)
-        results[review.review_id] = preprocessed.sentences
+    for review, review_preprocessed in zip(reviews, preprocessed):
+        results[review.review_id] = review_preprocessed.sentences
     return results
 
 
@@ -138,7 +138,8 @@ def stage_aggregate(
 def run_pipeline(
     reviews: List[RawReview],
     reference_date: Optional[datetime] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    max_workers: Optional[int] = None
 ) -> Dict[str, ListingIntelligence]:
     """
     Run the complete Guest Review Intelligence pipeline.
@@ -154,6 +155,9 @@ def run_pipeline(
         reviews: List of RawReview objects to analyze
         reference_date: Reference date for temporal weighting (default: now)
         verbose: If True, print progress information
+        max_workers: If set, analyze listings in a process pool of this size
+                     (each worker runs all stages for one listing). Listings
+                     are independent, so results are the same as sequential.
         
     Returns:
         Dict mapping listing_id to ListingIntelligence
@@ -164,6 +168,31 @@ def run_pipeline(
     if verbose:
         print(f"Processing {len(reviews)} reviews...")
     
+    if max_workers is not None:
+        reviews_by_listing: Dict[str, List[RawReview]] = defaultdict(list)
+        for review in reviews:
+            reviews_by_listing[review.listing_id].append(review)
+        
+        if len(reviews_by_listing) > 1:
+            if verbose:
+                print(f"Analyzing {len(reviews_by_listing)} listings with {max_workers} workers...")
+            
+            # Imported here: concurrent.futures.process pulls in multiprocessing,
+            # which the default sequential path never needs
+            from concurrent.futures import ProcessPoolExecutor
+            
+            results = {}
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                tasks = [(listing_reviews, reference_date) for listing_reviews in reviews_by_listing.values()]
+                for listing_results in executor.map(_run_listing_worker, tasks):
+                    results.update(listing_results)
+            
+            if verbose:
+                print(f"  - Generated intelligence for {len(results)} listings")
+                print("Pipeline complete!")
+            
+            return results
+    
     # Stage 1: Preprocess
     if verbose:
         print("Stage 1: Preprocessing reviews...")
@@ -196,6 +225,16 @@ def run_pipeline(
     return results
 
 
+def _run_listing_worker(
+    task: Tuple[List[RawReview], datetime]
+) -> Dict[str, ListingIntelligence]:
+    """Process-pool entry point: run every stage for one listing's reviews."""
+    reviews, reference_date = task
+    sentences_by_review = stage_preprocess(reviews)
+    processed_sentences = stage_detect_and_analyze(sentences_by_review)
+    return stage_aggregate(processed_sentences, reviews, reference_date)
+
+
 def run_pipeline_with_details(
     reviews: List[RawReview],
     reference_date: Optional[datetime] = None
@@ -18,7 +18,7 @@ Design Decisions:
 """
 
 import re
-from typing import List, Tuple
+from typing import List, Dict, Tuple, Optional, Pattern
 from dataclasses import dataclass
 
 
@@ -94,7 +94,48 @@ ABBREVIATIONS = {
 }
 
 
-@dataclass
+# =============================================================================
+# PRECOMPILED PATTERNS
+# =============================================================================
+# Built once at import. The tables above are treated as constants; rebuild
+# these if CONTRACTIONS or ABBREVIATIONS are changed at runtime.
+
+# Contraction rules in application order (longest first). Suffix rules
+# ("'m", "'ll", ...) are plain replacements; whole-word rules carry a
+# compiled word-boundary pattern.
+_CONTRACTION_RULES: List[Tuple[str, str, Optional[Pattern]]] = [
+    (
+        contraction,
+        expansion,
+        None if contraction.startswith("'")
+        else re.compile(r'\b' + re.escape(contraction) + r'\b', re.IGNORECASE)
+    )
+    for contraction, expansion in sorted(
+        CONTRACTIONS.items(), key=lambda x: len(x[0]), reverse=True
+    )
+]
+
+# Any abbreviation followed by a period (longest alternatives first)
+_ABBREVIATION_RE = re.compile(
+    r'\b(' + '|'.join(
+        re.escape(abbrev) for abbrev in sorted(ABBREVIATIONS, key=len, reverse=True)
+    ) + r')\.',
+    re.IGNORECASE
+)
+
+_NON_WORD_RE = re.compile(r'[^\w]')
+_NON_WORD_KEEP_UNDERSCORE_RE = re.compile(r'[^\w_]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_URL_RE = re.compile(r'http\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_REPEATED_PUNCT_RE = re.compile(r'([!?.]){2,}')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:\'-]')
+_DECIMAL_RE = re.compile(r'(\d)\.(\d)')
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+_PUNCT_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+
+@dataclass(slots=True)
 class PreprocessedText:
     """Container for original and processed text."""
     original: str
@@ -117,18 +158,23 @@ def expand_contractions(text: str) -> str:
     """
     result = text.lower()
     
-    # Sort by length (longest first) to handle overlapping patterns
-    sorted_contractions = sorted(CONTRACTIONS.items(), key=lambda x: len(x[0]), reverse=True)
+    # Lowercased ASCII text can only match a rule that occurs in it
+    # literally, so skip the regex for absent contractions. (Non-ASCII text
+    # runs every rule: case-insensitive Unicode matching is looser.)
+    ascii_only = result.isascii()
     
-    for contraction, expansion in sorted_contractions:
+    # Rules are sorted by length (longest first) to handle overlapping patterns
+    for contraction, expansion, pattern in _CONTRACTION_RULES:
+        if ascii_only and contraction not in result:
+            continue
+        
         # Use word boundaries where appropriate
-        if contraction.startswith("'"):
+        if pattern is None:
             # Suffix contractions like "'t", "'m", "'ll"
             result = result.replace(contraction, expansion)
         else:
             # Full word contractions
-            pattern = r'\b' + re.escape(contraction) + r'\b'
-            result = re.sub(pattern, expansion, result, flags=re.IGNORECASE)
+            result = pattern.sub(expansion, result)
     
     return result
 
@@ -157,7 +203,7 @@ def mark_negations(text: str) -> str:
     
     for word in words:
         # Clean word for comparison (remove punctuation)
-        clean_word = re.sub(r'[^\w]', '', word.lower())
+        clean_word = _NON_WORD_RE.sub('', word.lower())
         
         # Check if this word terminates negation
         if clean_word in NEGATION_TERMINATORS or any(t in word for t in '.!?'):
@@ -202,23 +248,23 @@ def clean_text(text: str) -> str:
         Cleaned text
     """
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     
     # Remove URLs
-    text = re.sub(r'http\S+|www\.\S+', '', text)
+    text = _URL_RE.sub('', text)
     
     # Remove email addresses
-    text = re.sub(r'\S+@\S+', '', text)
+    text = _EMAIL_RE.sub('', text)
     
     # Normalize quotes
     text = text.replace('"', '"').replace('"', '"')
     text = text.replace("'", "'").replace("'", "'")
     
     # Remove excessive punctuation (keep single instances)
-    text = re.sub(r'([!?.]){2,}', r'\1', text)
+    text = _REPEATED_PUNCT_RE.sub(r'\1', text)
     
     # Remove emojis and special unicode (keep basic punctuation and letters)
-    text = re.sub(r'[^\w\s.,!?;:\'-]', '', text)
+    text = _SPECIAL_CHARS_RE.sub('', text)
     
     return text.strip()
 
@@ -240,24 +286,23 @@ def split_sentences(text: str) -> List[str]:
         List of sentence strings
     """
     # Step 1: Protect abbreviations from splitting
-    protected = text
-    for abbrev in ABBREVIATIONS:
-        # Add placeholder to prevent split after abbreviation period
-        pattern = r'\b' + re.escape(abbrev) + r'\.'
-        protected = re.sub(pattern, abbrev.upper() + '<<<DOT>>>', protected, flags=re.IGNORECASE)
+    # (one pass over all abbreviations; placeholder prevents a split after the period)
+    protected = _ABBREVIATION_RE.sub(
+        lambda m: m.group(1).upper() + '<<<DOT>>>', text
+    )
     
     # Step 2: Protect decimal numbers
-    protected = re.sub(r'(\d)\.(\d)', r'\1<<<DOT>>>\2', protected)
+    protected = _DECIMAL_RE.sub(r'\1<<<DOT>>>\2', protected)
     
     # Step 3: Split on sentence-ending punctuation
     # Match period, exclamation, or question mark followed by space and capital
-    sentences = re.split(r'(?<=[.!?])\s+(?=[A-Z])', protected)
+    sentences = _SENTENCE_BOUNDARY_RE.split(protected)
     
     # Step 4: Also split on just punctuation if no capital follows
     final_sentences = []
     for sent in sentences:
         # Split on punctuation followed by space
-        sub_sents = re.split(r'(?<=[.!?])\s+', sent)
+        sub_sents = _PUNCT_BOUNDARY_RE.split(sent)
         final_sentences.extend(sub_sents)
     
     # Step 5: Restore protected markers
@@ -309,6 +354,43 @@ def preprocess_review(text: str) -> PreprocessedText:
     )
 
 
+def preprocess_batch(texts: List[str]) -> List[PreprocessedText]:
+    """
+    Preprocess many reviews at once.
+    
+    Same results as preprocess_review per text, but each distinct sentence
+    is expanded and negation-marked only once per batch (reviews reuse a
+    lot of identical sentences).
+    
+    Args:
+        texts: Raw review texts
+        
+    Returns:
+        PreprocessedText per input text, in input order
+    """
+    processed_by_sentence: Dict[str, str] = {}
+    results = []
+    
+    for text in texts:
+        sentences = split_sentences(clean_text(text))
+        
+        processed_sentences = []
+        for sent in sentences:
+            processed = processed_by_sentence.get(sent)
+            if processed is None:
+                processed = mark_negations(expand_contractions(sent))
+                processed_by_sentence[sent] = processed
+            processed_sentences.append(processed)
+        
+        results.append(PreprocessedText(
+            original=text,
+            processed=' '.join(processed_sentences),
+            sentences=processed_sentences
+        ))
+    
+    return results
+
+
 # =============================================================================
 # UTILITY FUNCTIONS
 # =============================================================================
@@ -338,7 +420,7 @@ def get_negation_aware_words(text: str) -> List[Tuple[str, bool]]:
     
     for word in words:
         # Remove punctuation and check negation
-        clean = re.sub(r'[^\w_]', '', word)
+        clean = _NON_WORD_KEEP_UNDERSCORE_RE.sub('', word)
         is_negated = has_negation_marker(clean)
         base_word = remove_negation_marker(clean).lower()
         
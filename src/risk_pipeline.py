@@ -19,9 +19,7 @@ from src.risk_schemas import (
     RiskLevel, ActionType, DriverSeverity,
     score_to_risk_level
 )
-from src.risk_scoring import (
-    compute_all_aspect_risks, compute_overall_risk
-)
+from src.risk_scoring import compute_all_aspect_risks
 from src.contradiction_detection import detect_all_contradictions
 from src.rating_lag import detect_rating_mismatch
 from src.action_mapper import map_risk_to_action
@@ -63,15 +61,12 @@ def assess_listing_risk(
     if verbose:
         print(f"Assessing risk for listing: {intelligence.listing_id}")
     
-    # Stage 1: Compute aspect risks
-    if verbose:
-        print("  Stage 1: Computing aspect risks...")
-    aspect_risks, aspect_drivers = compute_all_aspect_risks(intelligence)
-    
-    # Stage 2: Compute overall risk
+    # Stage 1 & 2: Compute aspect risks and overall risk in one pass
     if verbose:
-        print("  Stage 2: Computing overall risk...")
-    overall_risk_score = compute_overall_risk(aspect_risks)
+        print("  Stage 1-2: Computing aspect and overall risk...")
+    aspect_risks, aspect_drivers, overall_risk_score = compute_all_aspect_risks(
+        intelligence
+    )
     
     # Stage 3: Detect contradictions
     if verbose:
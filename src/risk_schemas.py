@@ -61,11 +61,15 @@ class FlagType(str, Enum):
     SAFETY_CONCERN = "safety_concern"
 
 
+# One bit per FlagType (7 flags fit in a single byte)
+_FLAG_BITS: Dict[FlagType, int] = {flag: 1 << i for i, flag in enumerate(FlagType)}
+
+
 # =============================================================================
 # RISK DRIVER SCHEMA
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RiskDriver:
     """
     Explains why a listing or aspect is flagged.
@@ -98,7 +102,7 @@ class RiskDriver:
 # ASPECT-LEVEL RISK
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AspectRisk:
     """
     Risk assessment for a single aspect.
@@ -138,7 +142,7 @@ class AspectRisk:
 # LISTING-LEVEL RISK ASSESSMENT
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class ListingRiskAssessment:
     """
     Complete risk assessment for a listing.
@@ -154,6 +158,7 @@ class ListingRiskAssessment:
         flags: Special condition flags detected
         risk_drivers: Detailed explanations of risk factors
         metadata: Additional context (review count, date range, etc.)
+        flag_bits: Bitmask of flags, derived from flags at construction
     """
     listing_id: str
     assessment_timestamp: datetime
@@ -164,6 +169,14 @@ class ListingRiskAssessment:
     flags: List[FlagType]
     risk_drivers: List[RiskDriver]
     metadata: Dict[str, Any] = field(default_factory=dict)
+    flag_bits: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.flag_bits = flags_to_bits(self.flags)
+    
+    def has_flag(self, flag: FlagType) -> bool:
+        """Check whether a flag was raised (single bit test)."""
+        return bool(self.flag_bits & _FLAG_BITS[flag])
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -186,6 +199,14 @@ class ListingRiskAssessment:
 # HELPER FUNCTIONS
 # =============================================================================
 
+def flags_to_bits(flags: List[FlagType]) -> int:
+    """Encode a list of flags as a bitmask (see ListingRiskAssessment.flag_bits)."""
+    bits = 0
+    for flag in flags:
+        bits |= _FLAG_BITS[flag]
+    return bits
+
+
 def score_to_risk_level(score: float) -> RiskLevel:
     """Convert numeric risk score to categorical level."""
     if score <= 30:
@@ -198,12 +219,23 @@ def score_to_risk_level(score: float) -> RiskLevel:
         return RiskLevel.CRITICAL
 
 
+# Position of each RiskLevel, built once so the hot path is a tuple index
+_RISK_INDEX: Dict[RiskLevel, int] = {
+    RiskLevel.LOW: 0,
+    RiskLevel.MODERATE: 1,
+    RiskLevel.HIGH: 2,
+    RiskLevel.CRITICAL: 3
+}
+
+# Action for each RiskLevel position (see _RISK_INDEX)
+_RISK_TO_ACTION = (
+    ActionType.IGNORE,
+    ActionType.MONITOR,
+    ActionType.FLAG,
+    ActionType.URGENT
+)
+
+
 def risk_level_to_action(level: RiskLevel) -> ActionType:
     """Map risk level to recommended action."""
-    mapping = {
-        RiskLevel.LOW: ActionType.IGNORE,
-        RiskLevel.MODERATE: ActionType.MONITOR,
-        RiskLevel.HIGH: ActionType.FLAG,
-        RiskLevel.CRITICAL: ActionType.URGENT
-    }
-    return mapping[level]
+    return _RISK_TO_ACTION[_RISK_INDEX[level]]
@@ -13,7 +13,7 @@ Design Decisions:
 5. Configurable weights for different operational priorities
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from dataclasses import replace
 
 from src.schemas import Aspect, AspectAggregation, ListingIntelligence, TrendDirection
@@ -38,6 +38,14 @@ ASPECT_WEIGHTS: Dict[str, float] = {
     "location": 0.7       # Harder to change, often known upfront
 }
 
+# ASPECT_WEIGHTS laid out in Aspect declaration order, indexed via _ASPECT_ORDER
+# (_ASPECTS maps the same index back to the enum member without Aspect(...))
+_ASPECTS: Tuple[Aspect, ...] = tuple(Aspect)
+_ASPECT_ORDER: Dict[str, int] = {aspect.value: i for i, aspect in enumerate(_ASPECTS)}
+_ASPECT_WEIGHT_TABLE: Tuple[float, ...] = tuple(
+    ASPECT_WEIGHTS.get(aspect.value, 1.0) for aspect in _ASPECTS
+)
+
 # Risk component weights (must sum to 100)
 SENTIMENT_WEIGHT = 50
 VARIANCE_WEIGHT = 25
@@ -57,6 +65,28 @@ HIGH_DISAGREEMENT_THRESHOLD = 0.4
 NEGATIVE_SENTIMENT_THRESHOLD = 0.0
 VERY_NEGATIVE_THRESHOLD = -0.3
 
+# Static part of each aspect-level driver: (severity, description format)
+# Descriptions are filled with the triggering value via str.format
+_DRIVER_TEMPLATES: Dict[str, Tuple[DriverSeverity, str]] = {
+    "very_negative_sentiment": (DriverSeverity.HIGH, "Strongly negative sentiment ({:.2f})"),
+    "negative_sentiment": (DriverSeverity.MEDIUM, "Negative sentiment ({:.2f})"),
+    "high_variance": (DriverSeverity.MEDIUM, "Inconsistent guest experiences (variance: {:.2f})"),
+    "declining_trend": (DriverSeverity.HIGH, "Sentiment is declining over time"),
+    "polarized_opinions": (DriverSeverity.MEDIUM, "Highly polarized reviews (disagreement: {:.2f})"),
+    "low_confidence": (DriverSeverity.LOW, "Limited data, risk score may be unreliable"),
+}
+
+# One bit per driver type, in template (and therefore report) order
+_DRIVER_BITS: Dict[str, int] = {
+    driver_type: 1 << i for i, driver_type in enumerate(_DRIVER_TEMPLATES)
+}
+
+# Driver-type names for every possible mask, so decoding is one index per aspect
+_DRIVER_TYPES_BY_MASK: Tuple[Tuple[str, ...], ...] = tuple(
+    tuple(driver_type for driver_type, bit in _DRIVER_BITS.items() if mask & bit)
+    for mask in range(1 << len(_DRIVER_BITS))
+)
+
 
 # =============================================================================
 # NORMALIZATION
@@ -84,6 +114,16 @@ def clamp(value: float, min_val: float = 0, max_val: float = 100) -> float:
 # ASPECT-LEVEL RISK
 # =============================================================================
 
+def _make_driver(
+    aspect: Aspect,
+    driver_type: str,
+    value: Optional[float] = None
+) -> RiskDriver:
+    """Build an aspect-level RiskDriver from its template."""
+    severity, description = _DRIVER_TEMPLATES[driver_type]
+    return RiskDriver(aspect.value, driver_type, severity, description.format(value), value)
+
+
 def compute_aspect_risk(
     aspect: Aspect,
     aggregation: AspectAggregation
@@ -103,6 +143,7 @@ def compute_aspect_risk(
         Tuple of (AspectRisk, list of RiskDrivers)
     """
     drivers = []
+    driver_mask = 0
     
     # Component 1: Sentiment (50 points max)
     sentiment_risk = normalize_sentiment_to_risk(aggregation.weighted_sentiment)
@@ -110,57 +151,40 @@ def compute_aspect_risk(
     
     # Generate driver for negative sentiment
     if aggregation.weighted_sentiment < VERY_NEGATIVE_THRESHOLD:
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="very_negative_sentiment",
-            severity=DriverSeverity.HIGH,
-            description=f"Strongly negative sentiment ({aggregation.weighted_sentiment:.2f})",
-            value=aggregation.weighted_sentiment
+        drivers.append(_make_driver(
+            aspect, "very_negative_sentiment", aggregation.weighted_sentiment
         ))
+        driver_mask |= _DRIVER_BITS["very_negative_sentiment"]
     elif aggregation.weighted_sentiment < NEGATIVE_SENTIMENT_THRESHOLD:
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="negative_sentiment",
-            severity=DriverSeverity.MEDIUM,
-            description=f"Negative sentiment ({aggregation.weighted_sentiment:.2f})",
-            value=aggregation.weighted_sentiment
+        drivers.append(_make_driver(
+            aspect, "negative_sentiment", aggregation.weighted_sentiment
         ))
+        driver_mask |= _DRIVER_BITS["negative_sentiment"]
     
     # Component 2: Variance (25 points max)
     # Cap variance contribution at 25 points
     variance_contribution = min(aggregation.sentiment_variance * 100, VARIANCE_WEIGHT)
     
     if aggregation.sentiment_variance > HIGH_VARIANCE_THRESHOLD:
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="high_variance",
-            severity=DriverSeverity.MEDIUM,
-            description=f"Inconsistent guest experiences (variance: {aggregation.sentiment_variance:.2f})",
-            value=aggregation.sentiment_variance
+        drivers.append(_make_driver(
+            aspect, "high_variance", aggregation.sentiment_variance
         ))
+        driver_mask |= _DRIVER_BITS["high_variance"]
     
     # Component 3: Trend (25 points max, can be negative for bonus)
     trend_penalty = TREND_PENALTIES.get(aggregation.recent_trend, 0)
     trend_contribution = max(0, trend_penalty)  # Floor at 0 for display
     
     if aggregation.recent_trend == TrendDirection.DECLINING:
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="declining_trend",
-            severity=DriverSeverity.HIGH,
-            description="Sentiment is declining over time",
-            value=None
-        ))
+        drivers.append(_make_driver(aspect, "declining_trend"))
+        driver_mask |= _DRIVER_BITS["declining_trend"]
     
     # High disagreement driver
     if aggregation.disagreement_score > HIGH_DISAGREEMENT_THRESHOLD:
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="polarized_opinions",
-            severity=DriverSeverity.MEDIUM,
-            description=f"Highly polarized reviews (disagreement: {aggregation.disagreement_score:.2f})",
-            value=aggregation.disagreement_score
+        drivers.append(_make_driver(
+            aspect, "polarized_opinions", aggregation.disagreement_score
         ))
+        driver_mask |= _DRIVER_BITS["polarized_opinions"]
     
     # Calculate base risk
     base_risk = sentiment_contribution + variance_contribution + trend_penalty
@@ -172,20 +196,17 @@ def compute_aspect_risk(
     if confidence_factor < 0.3:
         # Very low confidence - heavily discount the risk
         confidence_factor = max(0.3, confidence_factor)
-        drivers.append(RiskDriver(
-            aspect=aspect.value,
-            driver_type="low_confidence",
-            severity=DriverSeverity.LOW,
-            description=f"Limited data, risk score may be unreliable",
-            value=aggregation.confidence_score
+        drivers.append(_make_driver(
+            aspect, "low_confidence", aggregation.confidence_score
         ))
+        driver_mask |= _DRIVER_BITS["low_confidence"]
     
     final_risk = base_risk * confidence_factor
     final_risk = clamp(final_risk)
     
     # Determine risk level and create driver list for AspectRisk
     risk_level = score_to_risk_level(final_risk)
-    driver_types = [d.driver_type for d in drivers]
+    driver_types = list(_DRIVER_TYPES_BY_MASK[driver_mask])
     
     aspect_risk = AspectRisk(
         aspect=aspect,
@@ -202,27 +223,40 @@ def compute_aspect_risk(
 
 def compute_all_aspect_risks(
     intelligence: ListingIntelligence
-) -> Tuple[Dict[str, AspectRisk], List[RiskDriver]]:
+) -> Tuple[Dict[str, AspectRisk], List[RiskDriver], float]:
     """
     Compute risk for all aspects in a listing.
     
+    The overall weighted risk (see compute_overall_risk) is accumulated
+    in the same pass, so callers don't need a second loop over aspects.
+    
     Returns:
-        Tuple of (aspect_risks dict, all risk drivers)
+        Tuple of (aspect_risks dict, all risk drivers, overall risk score)
     """
     aspect_risks = {}
     all_drivers = []
+    total_weighted_risk = 0.0
+    total_weight = 0.0
     
     for aspect_name, aggregation in intelligence.aspect_aggregations.items():
-        try:
-            aspect = Aspect(aspect_name)
-        except ValueError:
+        index = _ASPECT_ORDER.get(aspect_name)
+        if index is None:
             continue
-            
+        aspect = _ASPECTS[index]
+        
         risk, drivers = compute_aspect_risk(aspect, aggregation)
         aspect_risks[aspect_name] = risk
         all_drivers.extend(drivers)
+        
+        # Only include aspects with mentions (non-zero contribution)
+        if risk.risk_score > 0:
+            weight = _ASPECT_WEIGHT_TABLE[index]
+            total_weighted_risk += risk.risk_score * weight
+            total_weight += weight
+    
+    overall_risk = total_weighted_risk / total_weight if total_weight else 0.0
     
-    return aspect_risks, all_drivers
+    return aspect_risks, all_drivers, overall_risk
 
 
 # =============================================================================
@@ -235,7 +269,8 @@ def compute_overall_risk(
     """
     Compute weighted average of aspect risks.
     
-    Uses ASPECT_WEIGHTS to prioritize important aspects.
+    Uses ASPECT_WEIGHTS to prioritize important aspects. The pipeline gets
+    this from compute_all_aspect_risks; use this for an existing dict.
     """
     if not aspect_risks:
         return 0.0
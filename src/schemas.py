@@ -40,7 +40,7 @@ class TrendDirection(str, Enum):
 # INPUT SCHEMA
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class RawReview:
     """
     Raw review as ingested from Airbnb data source.
@@ -69,7 +69,7 @@ class RawReview:
 # INTERMEDIATE SCHEMAS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AspectMatch:
     """
     Result of aspect detection and sentiment analysis for a single aspect
@@ -99,7 +99,7 @@ class AspectMatch:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessedSentence:
     """
     A sentence extracted from a review with aspect detection results.
@@ -132,7 +132,7 @@ class ProcessedSentence:
 # OUTPUT SCHEMAS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AspectAggregation:
     """
     Aggregated statistics for a single aspect across all reviews for a listing.
@@ -170,7 +170,7 @@ class AspectAggregation:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ListingIntelligence:
     """
     Complete aspect-level intelligence for a single listing.
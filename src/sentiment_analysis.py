@@ -19,8 +19,10 @@ Design Decisions:
 """
 
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field
 from src.schemas import Aspect, AspectMatch
 
 
@@ -228,23 +230,128 @@ NEGATION_FLIP_FACTOR = -0.8
 # Context window: how many words around aspect keywords to consider
 SENTIMENT_CONTEXT_WINDOW = 5
 
+# Proximity weight for each distance inside the context window
+# (closer = higher weight: 1 / (1 + 0.3 * distance))
+_DISTANCE_WEIGHTS: Tuple[float, ...] = tuple(
+    1.0 / (1.0 + distance * 0.3) for distance in range(SENTIMENT_CONTEXT_WINDOW + 1)
+)
+
+# Two-word modifiers ("a bit", "not very", ...) split out for the bigram check
+_BIGRAM_MODIFIERS: Dict[str, float] = {
+    phrase: value for phrase, value in INTENSITY_MODIFIERS.items() if ' ' in phrase
+}
+
+# Precompiled cleanup pattern for the per-word hot path
+_CLEAN_SUB = re.compile(r'[^\w]').sub
+
+# ASCII characters outside \w, for the bytes.translate fast path of
+# _strip_non_word (note '_' is a word character and is kept)
+_ASCII_NON_WORD = bytes(i for i in range(128) if not _CLEAN_SUB('', chr(i)))
+
+# Memoization sizes. Reviews reuse a limited vocabulary and many sentences
+# repeat verbatim, so hit rates are high. The lexicons are treated as
+# constants: call clear_sentiment_caches() after modifying them.
+SENTENCE_CACHE_SIZE = 4096
+WORD_CACHE_SIZE = 8192
+
+
+# =============================================================================
+# TOKENIZATION
+# =============================================================================
+
+@dataclass(slots=True)
+class _TokenizedSentence:
+    """
+    Token views of one sentence, built once and shared by every aspect.
+    
+    Attributes:
+        raw: The sentence as given
+        lower_words: Lowercased whitespace tokens
+        modifier_words: lower_words without punctuation (modifier lookup)
+        clean_words: lower_words without punctuation or _neg (keyword matching)
+        scores: Lexicon score per token (None if not a sentiment word)
+        negated: Whether each token carries a negation marker
+        hits: (position, modified score) for every sentiment token, with
+            intensity modifier and negation applied (unclamped)
+        word_positions: Positions of each distinct clean word
+    """
+    raw: str
+    lower_words: List[str]
+    modifier_words: List[str]
+    clean_words: List[str]
+    scores: List[Optional[float]]
+    negated: List[bool]
+    hits: List[Tuple[int, float]] = field(default_factory=list)
+    word_positions: Dict[str, List[int]] = field(default_factory=dict)
+
+
+def _strip_non_word(word: str) -> str:
+    """
+    Remove non-word characters (same result as _CLEAN_SUB('', word)).
+    
+    ASCII tokens take a bytes.translate deletion pass; anything else falls
+    back to the regex so Unicode word-character rules are preserved.
+    """
+    if word.isascii():
+        return word.encode('ascii').translate(None, _ASCII_NON_WORD).decode('ascii')
+    return _CLEAN_SUB('', word)
+
+
+def _tokenize(sentence: str) -> _TokenizedSentence:
+    """Split, clean and score a sentence once for all downstream lookups."""
+    raw_words = sentence.split()
+    lower_words = sentence.lower().split()
+    modifier_words = [
+        word if word.isalpha() else _strip_non_word(word)
+        for word in lower_words
+    ]
+    clean_words = [
+        word if word.isalpha() else _strip_non_word(word.replace("_neg", ""))
+        for word in lower_words
+    ]
+    scores = [_get_word_sentiment(word) for word in lower_words]
+    negated = [_is_negated(word) for word in raw_words]
+    tokens = _TokenizedSentence(
+        sentence, lower_words, modifier_words, clean_words, scores, negated
+    )
+    
+    # Inverted index of clean words, so keyword matching visits each distinct word once
+    word_positions = tokens.word_positions
+    for i, clean_word in enumerate(clean_words):
+        word_positions.setdefault(clean_word, []).append(i)
+    
+    # Aspect-independent scores, computed once and shared by every aspect
+    hits = tokens.hits
+    for i, base_score in enumerate(scores):
+        if base_score is not None:
+            modified_score = base_score * _get_intensity_modifier(tokens, i)
+            if negated[i]:
+                modified_score *= NEGATION_FLIP_FACTOR
+            hits.append((i, modified_score))
+    
+    return tokens
+
 
 # =============================================================================
 # ANALYSIS FUNCTIONS
 # =============================================================================
 
+@lru_cache(maxsize=WORD_CACHE_SIZE)
 def _get_word_sentiment(word: str) -> Optional[float]:
     """
     Get sentiment score for a single word.
     
     Returns None if word not in lexicon.
     """
-    clean_word = word.lower().replace("_neg", "")
-    clean_word = re.sub(r'[^\w]', '', clean_word)
+    # Plain alphabetic tokens (the common case) need no cleanup
+    if word.isalpha():
+        return SENTIMENT_LEXICON.get(word.lower())
+    
+    clean_word = _strip_non_word(word.lower().replace("_neg", ""))
     return SENTIMENT_LEXICON.get(clean_word)
 
 
-def _get_intensity_modifier(words: List[str], position: int) -> float:
+def _get_intensity_modifier(tokens: _TokenizedSentence, position: int) -> float:
     """
     Check if there's an intensity modifier before the given position.
     
@@ -253,22 +360,24 @@ def _get_intensity_modifier(words: List[str], position: int) -> float:
     if position <= 0:
         return 1.0
     
-    # Check previous 1-2 words for modifiers
-    for offset in [1, 2]:
-        if position - offset >= 0:
-            prev_word = words[position - offset].lower()
-            prev_word = re.sub(r'[^\w\s]', '', prev_word)
-            
-            if prev_word in INTENSITY_MODIFIERS:
-                return INTENSITY_MODIFIERS[prev_word]
-            
-            # Check two-word modifiers
-            if offset == 1 and position - 2 >= 0:
-                two_word = f"{words[position - 2]} {prev_word}".lower()
-                if two_word in INTENSITY_MODIFIERS:
-                    return INTENSITY_MODIFIERS[two_word]
+    modifier_words = tokens.modifier_words
     
-    return 1.0
+    # Previous word
+    prev_word = modifier_words[position - 1]
+    modifier = INTENSITY_MODIFIERS.get(prev_word)
+    if modifier is not None:
+        return modifier
+    
+    if position < 2:
+        return 1.0
+    
+    # Two-word modifier ending at the previous word
+    modifier = _BIGRAM_MODIFIERS.get(f"{tokens.lower_words[position - 2]} {prev_word}")
+    if modifier is not None:
+        return modifier
+    
+    # Word two back
+    return INTENSITY_MODIFIERS.get(modifier_words[position - 2], 1.0)
 
 
 def _is_negated(word: str) -> bool:
@@ -280,36 +389,84 @@ def compute_sentence_sentiment(sentence: str) -> Tuple[float, List[Tuple[str, fl
     """
     Compute overall sentiment of a sentence.
     
+    Results are memoized per sentence; callers get a fresh hits list.
+    
     Returns:
         Tuple of (overall_score, list of (word, score) pairs for explainability)
     """
+    score, hits = _compute_sentence_sentiment_cached(sentence)
+    return score, list(hits)
+
+
+def compute_sentences_sentiment_batch(sentences: List[str]) -> List[float]:
+    """
+    Compute overall sentiment for many sentences at once.
+    
+    Scores only (no per-word hits). Repeated sentences are scored once via
+    the shared sentence cache.
+    
+    Returns:
+        List of overall scores, aligned with the input sentences
+    """
+    cached = _compute_sentence_sentiment_cached
+    return [cached(sentence)[0] for sentence in sentences]
+
+
+@lru_cache(maxsize=SENTENCE_CACHE_SIZE)
+def _compute_sentence_sentiment_cached(
+    sentence: str
+) -> Tuple[float, Tuple[Tuple[str, float], ...]]:
+    """Cached body of compute_sentence_sentiment (hits as a tuple)."""
+    tokens = _tokenize(sentence)
     words = sentence.split()
     sentiment_hits = []
     
-    for i, word in enumerate(words):
-        base_score = _get_word_sentiment(word)
+    # Intensity modifier and negation flip are already applied per hit
+    for i, modified_score in tokens.hits:
+        # Clamp to [-1, 1]
+        modified_score = max(-1.0, min(1.0, modified_score))
         
-        if base_score is not None:
-            # Apply intensity modifier
-            modifier = _get_intensity_modifier(words, i)
-            modified_score = base_score * modifier
-            
-            # Apply negation flip if marked
-            if _is_negated(word):
-                modified_score *= NEGATION_FLIP_FACTOR
-            
-            # Clamp to [-1, 1]
-            modified_score = max(-1.0, min(1.0, modified_score))
-            
-            clean_word = re.sub(r'[^\w]', '', word.replace("_NEG", ""))
-            sentiment_hits.append((clean_word, modified_score))
+        clean_word = _strip_non_word(words[i].replace("_NEG", ""))
+        sentiment_hits.append((clean_word, modified_score))
     
     if not sentiment_hits:
-        return 0.0, []
+        return 0.0, ()
     
     # Compute average sentiment
     avg_score = sum(score for _, score in sentiment_hits) / len(sentiment_hits)
-    return avg_score, sentiment_hits
+    return avg_score, tuple(sentiment_hits)
+
+
+def _proximity_weighted_score(
+    tokens: _TokenizedSentence,
+    keyword_positions: List[int]
+) -> Optional[float]:
+    """
+    Average the sentiment words near aspect keywords, weighted by proximity.
+    
+    Only words within SENTIMENT_CONTEXT_WINDOW of the nearest keyword count.
+    Uses the per-sentence hits, so modifiers and negation are already applied.
+    
+    Returns:
+        Weighted average score, or None if no sentiment word is in range
+    """
+    weighted_sum = 0.0
+    total_weight = 0.0
+    
+    for i, modified_score in tokens.hits:
+        # Minimum distance to any aspect keyword
+        min_distance = min([abs(i - pos) for pos in keyword_positions])
+        if min_distance > SENTIMENT_CONTEXT_WINDOW:
+            continue
+        
+        distance_weight = _DISTANCE_WEIGHTS[min_distance]
+        
+        weighted_sum += modified_score * distance_weight
+        total_weight += distance_weight
+    
+    if total_weight > 0:
+        return weighted_sum / total_weight
+    return None
 
 
 def analyze_aspect_sentiment(
@@ -332,54 +489,32 @@ def analyze_aspect_sentiment(
     Returns:
         Updated AspectMatch with computed sentiment_score
     """
-    words = sentence.lower().split()
-    
-    # Find positions of aspect keywords
+    return _analyze_aspect_sentiment_tokens(_tokenize(sentence), aspect_match)
+
+
+def _analyze_aspect_sentiment_tokens(
+    tokens: _TokenizedSentence,
+    aspect_match: AspectMatch
+) -> AspectMatch:
+    """analyze_aspect_sentiment on an already tokenized sentence."""
+    # Find positions of aspect keywords (substring match either way)
     keyword_positions = []
+    word_positions = tokens.word_positions
     for keyword in aspect_match.matched_keywords:
-        for i, word in enumerate(words):
-            clean_word = re.sub(r'[^\w]', '', word.replace("_neg", ""))
-            if keyword.lower() in clean_word or clean_word in keyword.lower():
-                keyword_positions.append(i)
+        keyword = keyword.lower()
+        for clean_word, positions in word_positions.items():
+            if keyword in clean_word or clean_word in keyword:
+                keyword_positions.extend(positions)
     
     if not keyword_positions:
         # Fallback: use sentence-level sentiment
-        overall_score, _ = compute_sentence_sentiment(sentence)
-        return replace(aspect_match, sentiment_score=overall_score)
+        overall_score = _compute_sentence_sentiment_cached(tokens.raw)[0]
+        return _with_sentiment(aspect_match, overall_score)
     
-    # Collect sentiment scores weighted by proximity to keywords
-    weighted_scores = []
-    total_weight = 0.0
-    
-    for i, word in enumerate(words):
-        base_score = _get_word_sentiment(word)
-        
-        if base_score is not None:
-            # Calculate minimum distance to any aspect keyword
-            min_distance = min(abs(i - pos) for pos in keyword_positions)
-            
-            # Only consider words within context window
-            if min_distance > SENTIMENT_CONTEXT_WINDOW:
-                continue
-            
-            # Weight inversely by distance (closer = higher weight)
-            distance_weight = 1.0 / (1.0 + min_distance * 0.3)
-            
-            # Apply intensity modifier
-            modifier = _get_intensity_modifier(words, i)
-            modified_score = base_score * modifier
-            
-            # Apply negation if word is marked
-            if _is_negated(word):
-                modified_score *= NEGATION_FLIP_FACTOR
-            
-            weighted_scores.append(modified_score * distance_weight)
-            total_weight += distance_weight
+    # Weighted average of sentiment words near the keywords
+    final_score = _proximity_weighted_score(tokens, keyword_positions)
     
-    # Calculate weighted average
-    if weighted_scores and total_weight > 0:
-        final_score = sum(weighted_scores) / total_weight
-    else:
+    if final_score is None:
         # No sentiment words found near aspect - check if aspect keyword itself has sentiment
         # (e.g., "clean" is both aspect and sentiment)
         final_score = 0.0
@@ -396,7 +531,23 @@ def analyze_aspect_sentiment(
     # Clamp final score
     final_score = max(-1.0, min(1.0, final_score))
     
-    return replace(aspect_match, sentiment_score=final_score)
+    return _with_sentiment(aspect_match, final_score)
+
+
+def _with_sentiment(aspect_match: AspectMatch, sentiment_score: float) -> AspectMatch:
+    """
+    Copy of aspect_match with sentiment_score set.
+    
+    Direct construction instead of dataclasses.replace(), which re-inspects
+    the dataclass fields on every call. Keep in step with AspectMatch fields.
+    """
+    return AspectMatch(
+        aspect_match.aspect,
+        sentiment_score,
+        aspect_match.confidence,
+        aspect_match.matched_keywords,
+        aspect_match.has_negation
+    )
 
 
 def analyze_aspects_sentiments(
@@ -413,7 +564,8 @@ def analyze_aspects_sentiments(
     Returns:
         List of AspectMatch objects with sentiment_score filled in
     """
-    return [analyze_aspect_sentiment(sentence, am) for am in aspect_matches]
+    tokens = _tokenize(sentence)
+    return [_analyze_aspect_sentiment_tokens(tokens, am) for am in aspect_matches]
 
 
 # =============================================================================
@@ -428,36 +580,48 @@ def explain_sentiment(sentence: str) -> Dict:
     - overall_score: float
     - word_scores: list of {word, base_score, modifier, negated, final_score}
     """
-    words = sentence.split()
-    explanations = []
+    columns = explain_sentiment_columns(sentence)
+    final_scores = columns['final_score']
     
-    for i, word in enumerate(words):
-        base_score = _get_word_sentiment(word)
-        
-        if base_score is not None:
-            modifier = _get_intensity_modifier(words, i)
-            negated = _is_negated(word)
-            
-            final = base_score * modifier
-            if negated:
-                final *= NEGATION_FLIP_FACTOR
-            
-            explanations.append({
-                'word': word.replace("_NEG", ""),
-                'base_score': base_score,
-                'modifier': modifier,
-                'negated': negated,
-                'final_score': round(final, 3)
-            })
-    
-    overall = sum(e['final_score'] for e in explanations) / len(explanations) if explanations else 0.0
+    overall = sum(final_scores) / len(final_scores) if final_scores else 0.0
     
     return {
         'overall_score': round(overall, 3),
-        'word_scores': explanations
+        'word_scores': [dict(zip(columns, row)) for row in zip(*columns.values())]
     }
 
 
+def explain_sentiment_columns(sentence: str) -> Dict[str, List]:
+    """
+    Per-word sentiment explanation as parallel columns.
+    
+    Same data as explain_sentiment's word_scores, but one list per field
+    (word, base_score, modifier, negated, final_score) instead of one dict
+    per word - cheaper for bulk use such as plotting many sentences.
+    """
+    tokens = _tokenize(sentence)
+    words = sentence.split()
+    columns: Dict[str, List] = {
+        'word': [], 'base_score': [], 'modifier': [], 'negated': [], 'final_score': []
+    }
+    
+    # Hits carry the modified score (base * modifier, negation flipped)
+    for i, final in tokens.hits:
+        columns['word'].append(words[i].replace("_NEG", ""))
+        columns['base_score'].append(tokens.scores[i])
+        columns['modifier'].append(_get_intensity_modifier(tokens, i))
+        columns['negated'].append(tokens.negated[i])
+        columns['final_score'].append(round(final, 3))
+    
+    return columns
+
+
+def clear_sentiment_caches() -> None:
+    """Drop memoized word and sentence scores (e.g. after editing a lexicon)."""
+    _get_word_sentiment.cache_clear()
+    _compute_sentence_sentiment_cached.cache_clear()
+
+
 def get_sentiment_category(score: float) -> str:
     """
     Convert numeric score to categorical label.
@@ -479,3 +643,20 @@ def get_sentiment_category(score: float) -> str:
         return "positive"
     else:
         return "very_positive"
+
+
+# Category boundaries and labels for bulk categorization (same cut points as above)
+_CATEGORY_BOUNDS: Tuple[float, ...] = (-0.6, -0.2, 0.2, 0.6)
+_CATEGORY_LABELS: Tuple[str, ...] = (
+    "very_negative", "negative", "neutral", "positive", "very_positive"
+)
+
+
+def get_sentiment_categories(scores: List[float]) -> List[str]:
+    """
+    Convert many numeric scores to categorical labels.
+    
+    Equivalent to calling get_sentiment_category per score, but uses a
+    binary search over the category boundaries instead of the if-chain.
+    """
+    return [_CATEGORY_LABELS[bisect_right(_CATEGORY_BOUNDS, score)] for score in scores]
@@ -168,6 +168,30 @@ GENERIC_NEGATIVE = [
     "Won't be returning.",
 ]
 
+# Phrase tuples indexed by sentiment then aspect ("neutral" also covers unknown labels)
+PHRASES_BY_SENTIMENT: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    sentiment: {aspect: tuple(phrases) for aspect, phrases in table.items()}
+    for sentiment, table in (
+        ("positive", POSITIVE_PHRASES),
+        ("negative", NEGATIVE_PHRASES),
+        ("neutral", NEUTRAL_PHRASES),
+    )
+}
+GENERIC_BY_SENTIMENT: Dict[str, Tuple[str, ...]] = {
+    "positive": tuple(GENERIC_POSITIVE),
+    "negative": tuple(GENERIC_NEGATIVE),
+}
+
+# Per-aspect sentiment sampling weights (positive, neutral, negative) by listing quality
+SENTIMENT_LABELS: Tuple[str, ...] = ("positive", "neutral", "negative")
+QUALITY_SENTIMENT_WEIGHTS: Dict[str, Tuple[float, float, float]] = {
+    "excellent": (0.85, 0.12, 0.03),  # Mostly positive with occasional neutral
+    "good": (0.70, 0.22, 0.08),       # Mostly positive with some neutral and rare negative
+    "average": (0.40, 0.35, 0.25),    # Mix of all
+    "poor": (0.15, 0.20, 0.65),       # Mostly negative
+    "mixed": (0.50, 0.00, 0.50),      # Polarized: either very positive or very negative
+}
+
 # Reviewer names for realism
 FIRST_NAMES = [
     "John", "Sarah", "Michael", "Emma", "David", "Lisa", "James", "Anna",
@@ -204,29 +228,28 @@ def generate_review_text(
         aspects = random.sample(aspects, num_aspects)
     
     # Add aspect-specific sentences
+    neutral_table = PHRASES_BY_SENTIMENT["neutral"]
     for aspect in aspects:
         sentiment = sentiment_profile.get(aspect, "neutral")
-        
-        if sentiment == "positive":
-            phrases = POSITIVE_PHRASES.get(aspect, [])
-        elif sentiment == "negative":
-            phrases = NEGATIVE_PHRASES.get(aspect, [])
-        else:
-            phrases = NEUTRAL_PHRASES.get(aspect, [])
+        phrases = PHRASES_BY_SENTIMENT.get(sentiment, neutral_table).get(aspect, ())
         
         if phrases:
             sentences.append(random.choice(phrases))
     
     # Add generic sentences
     if include_generic:
-        # Check overall sentiment
-        positive_count = sum(1 for s in sentiment_profile.values() if s == "positive")
-        negative_count = sum(1 for s in sentiment_profile.values() if s == "negative")
+        # Check overall sentiment (single pass over the profile)
+        balance = 0
+        for s in sentiment_profile.values():
+            if s == "positive":
+                balance += 1
+            elif s == "negative":
+                balance -= 1
         
-        if positive_count > negative_count:
-            sentences.append(random.choice(GENERIC_POSITIVE))
-        elif negative_count > positive_count:
-            sentences.append(random.choice(GENERIC_NEGATIVE))
+        if balance > 0:
+            sentences.append(random.choice(GENERIC_BY_SENTIMENT["positive"]))
+        elif balance < 0:
+            sentences.append(random.choice(GENERIC_BY_SENTIMENT["negative"]))
     
     # Shuffle for variety
     random.shuffle(sentences)
@@ -261,17 +284,15 @@ def generate_date_sequence(
 ) -> List[datetime]:
     """Generate a sequence of review dates, slightly clustered in recent months."""
     total_days = (end_date - start_date).days
-    dates = []
     
-    for _ in range(n_reviews):
-        # Bias toward more recent dates (exponential distribution)
-        # This creates a realistic pattern where recent months have more reviews
-        random_factor = random.random() ** 0.7  # Skew toward 0 (more recent)
-        days_ago = int(random_factor * total_days)
-        review_date = end_date - timedelta(days=days_ago)
-        dates.append(review_date)
+    # Bias toward more recent dates (exponential distribution)
+    # This creates a realistic pattern where recent months have more reviews
+    # random() ** 0.7 skews toward 0 (more recent)
+    days_ago = [int(random.random() ** 0.7 * total_days) for _ in range(n_reviews)]
     
-    return sorted(dates)
+    # Sort the integer offsets (oldest first) rather than the datetimes
+    days_ago.sort(reverse=True)
+    return [end_date - timedelta(days=d) for d in days_ago]
 
 
 def generate_listing_reviews(
@@ -302,59 +323,33 @@ def generate_listing_reviews(
     
     # Define sentiment profiles based on listing quality
     aspect_names = ["cleanliness", "noise", "location", "host_behavior", "amenities", "safety"]
+    n_aspects = len(aspect_names)
     
-    reviews = []
-    for date in dates:
-        # Generate sentiment profile based on listing quality
-        profile = {}
-        
-        for aspect in aspect_names:
-            if listing_quality == "excellent":
-                # Mostly positive with occasional neutral
-                sentiment = random.choices(
-                    ["positive", "neutral", "negative"],
-                    weights=[0.85, 0.12, 0.03]
-                )[0]
-            elif listing_quality == "good":
-                # Mostly positive with some neutral and rare negative
-                sentiment = random.choices(
-                    ["positive", "neutral", "negative"],
-                    weights=[0.70, 0.22, 0.08]
-                )[0]
-            elif listing_quality == "average":
-                # Mix of all
-                sentiment = random.choices(
-                    ["positive", "neutral", "negative"],
-                    weights=[0.40, 0.35, 0.25]
-                )[0]
-            elif listing_quality == "poor":
-                # Mostly negative
-                sentiment = random.choices(
-                    ["positive", "neutral", "negative"],
-                    weights=[0.15, 0.20, 0.65]
-                )[0]
-            else:  # mixed - polarized reviews
-                # Either very positive or very negative
-                sentiment = random.choices(
-                    ["positive", "negative"],
-                    weights=[0.5, 0.5]
-                )[0]
-            
-            profile[aspect] = sentiment
-        
-        # Randomly select 2-4 aspects to mention
-        num_aspects = random.randint(2, 4)
-        
-        review = generate_review(listing_id, date, profile, num_aspects)
-        reviews.append(review)
-    
-    return reviews
+    # Draw every review's per-aspect sentiment in one batch
+    # (unknown qualities fall back to the polarized "mixed" profile)
+    weights = QUALITY_SENTIMENT_WEIGHTS.get(
+        listing_quality, QUALITY_SENTIMENT_WEIGHTS["mixed"]
+    )
+    sentiments = random.choices(SENTIMENT_LABELS, weights=weights, k=len(dates) * n_aspects)
+    
+    # One review per date: its slice of the sentiment batch as the profile,
+    # mentioning a random 2-4 aspects
+    return [
+        generate_review(
+            listing_id,
+            date,
+            dict(zip(aspect_names, sentiments[i * n_aspects:(i + 1) * n_aspects])),
+            random.randint(2, 4)
+        )
+        for i, date in enumerate(dates)
+    ]
 
 
 def generate_synthetic_dataset(
     n_listings: int = 5,
     reviews_per_listing: int = 20,
-    quality_distribution: Optional[Dict[str, int]] = None
+    quality_distribution: Optional[Dict[str, int]] = None,
+    n_workers: Optional[int] = None
 ) -> List[RawReview]:
     """
     Generate a complete synthetic dataset with multiple listings.
@@ -364,6 +359,10 @@ def generate_synthetic_dataset(
         reviews_per_listing: Reviews per listing (can vary ±5)
         quality_distribution: Dict specifying how many listings of each quality
                             e.g., {"excellent": 1, "good": 2, "average": 1, "poor": 1}
+        n_workers: If set, generate listings in a process pool of this size.
+                   Each listing gets its own seed drawn from `random`, so
+                   output is reproducible under random.seed() but differs
+                   from the sequential (default) path.
                             
     Returns:
         List of all generated RawReview objects
@@ -388,6 +387,26 @@ def generate_synthetic_dataset(
     qualities = qualities[:n_listings]
     random.shuffle(qualities)
     
+    if n_workers is not None:
+        tasks = [
+            (
+                f"listing_{i+1:04d}",
+                max(5, reviews_per_listing + random.randint(-5, 5)),
+                qualities[i],
+                random.getrandbits(64),
+            )
+            for i in range(n_listings)
+        ]
+        # Imported here so the sequential default doesn't load multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return [
+                review
+                for reviews in executor.map(_generate_listing_worker, tasks)
+                for review in reviews
+            ]
+    
     all_reviews = []
     
     for i in range(n_listings):
@@ -404,6 +423,13 @@ def generate_synthetic_dataset(
     return all_reviews
 
 
+def _generate_listing_worker(task: Tuple[str, int, str, int]) -> List[RawReview]:
+    """Process-pool entry point: seed this worker's RNG, then generate one listing."""
+    listing_id, n_reviews, quality, seed = task
+    random.seed(seed)
+    return generate_listing_reviews(listing_id, n_reviews, quality)
+
+
 # =============================================================================
 # SPECIFIC TEST SCENARIOS
 # =============================================================================
@@ -427,18 +453,16 @@ def generate_negation_test_reviews() -> List[RawReview]:
         "The location was excellent and the host was very helpful.",
     ]
     
-    reviews = []
-    for i, text in enumerate(test_cases):
-        review = RawReview(
+    return [
+        RawReview(
             review_id=f"negation_test_{i+1}",
             listing_id="test_listing_001",
             reviewer_name="TestReviewer",
             review_date=now - timedelta(days=i*30),
             review_text=text
         )
-        reviews.append(review)
-    
-    return reviews
+        for i, text in enumerate(test_cases)
+    ]
 
 
 def generate_temporal_test_reviews() -> List[RawReview]:
@@ -453,35 +477,15 @@ def generate_temporal_test_reviews() -> List[RawReview]:
     negative raw average.
     """
     now = datetime.now()
-    reviews = []
     
-    # Old negative reviews (12-24 months ago)
-    for i in range(10):
-        days_ago = random.randint(365, 730)
-        review = RawReview(
-            review_id=f"temporal_old_{i+1}",
-            listing_id="temporal_test_listing",
-            reviewer_name=random.choice(FIRST_NAMES),
-            review_date=now - timedelta(days=days_ago),
-            review_text=random.choice(NEGATIVE_PHRASES["cleanliness"]) + " " + 
-                       random.choice(NEGATIVE_PHRASES["host_behavior"])
-        )
-        reviews.append(review)
-    
-    # Recent positive reviews (0-90 days ago)
-    for i in range(10):
-        days_ago = random.randint(0, 90)
-        review = RawReview(
-            review_id=f"temporal_recent_{i+1}",
-            listing_id="temporal_test_listing",
-            reviewer_name=random.choice(FIRST_NAMES),
-            review_date=now - timedelta(days=days_ago),
-            review_text=random.choice(POSITIVE_PHRASES["cleanliness"]) + " " +
-                       random.choice(POSITIVE_PHRASES["host_behavior"])
-        )
-        reviews.append(review)
-    
-    return reviews
+    # Old negative reviews (12-24 months ago), then recent positive reviews (0-90 days ago)
+    return _sample_phrase_reviews(
+        "temporal_old", "temporal_test_listing", 10, (365, 730), now, "{} {}",
+        NEGATIVE_PHRASES["cleanliness"], NEGATIVE_PHRASES["host_behavior"]
+    ) + _sample_phrase_reviews(
+        "temporal_recent", "temporal_test_listing", 10, (0, 90), now, "{} {}",
+        POSITIVE_PHRASES["cleanliness"], POSITIVE_PHRASES["host_behavior"]
+    )
 
 
 def generate_polarized_test_reviews() -> List[RawReview]:
@@ -492,32 +496,47 @@ def generate_polarized_test_reviews() -> List[RawReview]:
     very positive and half are very negative.
     """
     now = datetime.now()
-    reviews = []
     
-    # Very positive reviews
-    for i in range(10):
-        days_ago = random.randint(0, 365)
-        review = RawReview(
-            review_id=f"polar_positive_{i+1}",
-            listing_id="polarized_test_listing",
-            reviewer_name=random.choice(FIRST_NAMES),
-            review_date=now - timedelta(days=days_ago),
-            review_text="Amazing place! " + random.choice(POSITIVE_PHRASES["cleanliness"]) + 
-                       " " + random.choice(POSITIVE_PHRASES["location"]) + " Highly recommend!"
-        )
-        reviews.append(review)
+    # Very positive reviews, then very negative reviews
+    return _sample_phrase_reviews(
+        "polar_positive", "polarized_test_listing", 10, (0, 365), now,
+        "Amazing place! {} {} Highly recommend!",
+        POSITIVE_PHRASES["cleanliness"], POSITIVE_PHRASES["location"]
+    ) + _sample_phrase_reviews(
+        "polar_negative", "polarized_test_listing", 10, (0, 365), now,
+        "Terrible experience! {} {} Avoid!",
+        NEGATIVE_PHRASES["cleanliness"], NEGATIVE_PHRASES["location"]
+    )
+
+
+def _sample_phrase_reviews(
+    id_prefix: str,
+    listing_id: str,
+    n_reviews: int,
+    days_ago_range: Tuple[int, int],
+    now: datetime,
+    template: str,
+    *phrase_lists: List[str]
+) -> List[RawReview]:
+    """
+    Build reviews whose text fills template with one random phrase per list.
     
-    # Very negative reviews
-    for i in range(10):
-        days_ago = random.randint(0, 365)
-        review = RawReview(
-            review_id=f"polar_negative_{i+1}",
-            listing_id="polarized_test_listing",
-            reviewer_name=random.choice(FIRST_NAMES),
-            review_date=now - timedelta(days=days_ago),
-            review_text="Terrible experience! " + random.choice(NEGATIVE_PHRASES["cleanliness"]) +
-                       " " + random.choice(NEGATIVE_PHRASES["location"]) + " Avoid!"
+    Names, dates and phrases are each drawn in one batch up front.
+    """
+    min_days, max_days = days_ago_range
+    names = random.choices(FIRST_NAMES, k=n_reviews)
+    review_dates = [
+        now - timedelta(days=random.randint(min_days, max_days)) for _ in range(n_reviews)
+    ]
+    phrase_picks = [random.choices(phrases, k=n_reviews) for phrases in phrase_lists]
+    
+    return [
+        RawReview(
+            review_id=f"{id_prefix}_{i+1}",
+            listing_id=listing_id,
+            reviewer_name=name,
+            review_date=review_date,
+            review_text=template.format(*phrases)
         )
-        reviews.append(review)
-    
-    return reviews
+        for i, (name, review_date, *phrases) in enumerate(zip(names, review_dates, *phrase_picks))
+    ]
@@ -18,10 +18,13 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.schemas import RawReview, Aspect
-from src.preprocessing import preprocess_review, mark_negations, expand_contractions
+from src.preprocessing import preprocess_review, preprocess_batch, mark_negations, expand_contractions
 from src.aspect_detection import detect_aspects_in_sentence
-from src.sentiment_analysis import analyze_aspect_sentiment, compute_sentence_sentiment
-from src.aggregation import compute_temporal_weight, aggregate_by_listing
+from src.sentiment_analysis import (
+    analyze_aspect_sentiment, compute_sentence_sentiment, compute_sentences_sentiment_batch,
+    get_sentiment_category, get_sentiment_categories
+)
+from src.aggregation import compute_temporal_weight, compute_temporal_weights, aggregate_by_listing
 from src.confidence import compute_disagreement, compute_confidence
 from src.pipeline import run_pipeline, analyze_single_review
 from tests.synthetic_data import generate_synthetic_dataset, generate_negation_test_reviews
@@ -53,6 +56,12 @@ class TestPreprocessing:
         text = "The host wasn't helpful."
         result = preprocess_review(text)
         assert result.original == text
+    
+    def test_batch_matches_single(self):
+        """Test that batch preprocessing equals per-review preprocessing."""
+        texts = ["The host wasn't helpful. Clean room.", "Clean room. Not quiet at all!", ""]
+        
+        assert preprocess_batch(texts) == [preprocess_review(t) for t in texts]
 
 
 class TestAspectDetection:
@@ -108,6 +117,19 @@ class TestSentimentAnalysis:
         
         assert score_pos > 0
         assert score_neg < 0
+    
+    def test_batch_matches_single(self):
+        """Test that batch scoring agrees with per-sentence scoring."""
+        sentences = ["very clean", "clean_NEG", "terrible awful", "no opinion", "very clean"]
+        scores = compute_sentences_sentiment_batch(sentences)
+        
+        assert scores == [compute_sentence_sentiment(s)[0] for s in sentences]
+
+    def test_bulk_categories_match_scalar(self):
+        """Test that bulk categorization agrees at and around the boundaries."""
+        scores = [-1.0, -0.6, -0.59, -0.2, 0.0, 0.2, 0.59, 0.6, 1.0]
+        
+        assert get_sentiment_categories(scores) == [get_sentiment_category(s) for s in scores]
 
 
 class TestTemporalWeighting:
@@ -136,6 +158,14 @@ class TestTemporalWeighting:
         half_life = now - timedelta(days=180)
         weight = compute_temporal_weight(half_life, now, half_life_days=180)
         assert weight == pytest.approx(0.5, abs=0.01)
+    
+    def test_batch_weights_match_scalar(self):
+        """Test that batch weights equal per-date weights (incl. repeats and future dates)."""
+        now = datetime.now()
+        dates = [now - timedelta(days=d) for d in (0, 7, 7, 365, -3, 180)]
+        
+        weights = compute_temporal_weights(dates, now)
+        assert weights == [compute_temporal_weight(d, now) for d in dates]
 
 
 class TestConfidence:
@@ -169,6 +199,24 @@ class TestPipelineIntegration:
         results = run_pipeline(reviews)
         assert len(results) == 2
     
+    def test_parallel_pipeline_matches_sequential(self):
+        """Test that per-listing process-pool analysis gives the same results."""
+        reviews = generate_synthetic_dataset(n_listings=3, reviews_per_listing=8)
+        now = datetime.now()
+        
+        sequential = run_pipeline(reviews, reference_date=now)
+        parallel = run_pipeline(reviews, reference_date=now, max_workers=2)
+        
+        assert {k: v.to_dict() for k, v in parallel.items()} == \
+            {k: v.to_dict() for k, v in sequential.items()}
+    
+    def test_parallel_dataset_generation(self):
+        """Test that process-pool generation yields every listing."""
+        reviews = generate_synthetic_dataset(n_listings=3, reviews_per_listing=5, n_workers=2)
+        
+        assert {r.listing_id for r in reviews} == {"listing_0001", "listing_0002", "listing_0003"}
+        assert all(r.review_text for r in reviews)
+    
     def test_output_structure(self):
         """Test that output has correct structure."""
         reviews = generate_synthetic_dataset(n_listings=1, reviews_per_listing=5)
@@ -323,6 +323,21 @@ class TestRiskPipeline:
         assert 'overall_risk_score' in parsed
         assert 'recommended_action' in parsed
 
+    def test_has_flag_matches_flags(self):
+        """Test that the flag bitmask agrees with the flags list."""
+        intelligence = create_test_intelligence({
+            'safety': create_test_aggregation(
+                Aspect.SAFETY,
+                sentiment=-0.5,
+                mentions=5
+            )
+        })
+        assessment = assess_listing_risk(intelligence)
+
+        for flag in FlagType:
+            assert assessment.has_flag(flag) == (flag in assessment.flags)
+        assert assessment.has_flag(FlagType.SAFETY_CONCERN)
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])